@@ -33,4 +33,36 @@ class Excel(object):
         writer_write.save()
 
 
+class WriteExcelStreaming(object):
+
+    params = ['openpyxl', 'xlsxwriter']
+    param_names = ['engine']
+    streaming_kwargs = {'openpyxl': {'write_only': True},
+                        'xlsxwriter': {'constant_memory': True}}
+
+    def setup(self, engine):
+        N = 20000
+        C = 5
+        self.df = DataFrame(np.random.randn(N, C),
+                            columns=['float{}'.format(i) for i in range(C)],
+                            index=date_range('20000101', periods=N, freq='H'))
+        self.df['object'] = tm.makeStringIndex(N)
+
+    def time_write_excel(self, engine):
+        bio = BytesIO()
+        writer = ExcelWriter(bio, engine=engine)
+        self.df.to_excel(writer, sheet_name='Sheet1')
+        writer.save()
+
+    def time_write_excel_streaming(self, engine):
+        bio = BytesIO()
+        writer = ExcelWriter(bio, engine=engine,
+                             **self.streaming_kwargs[engine])
+        self.df.to_excel(writer, sheet_name='Sheet1')
+        writer.save()
+
+    def peakmem_write_excel_streaming(self, engine):
+        self.time_write_excel_streaming(engine)
+
+
 from ..pandas_vb_common import setup  # noqa: F401
@@ -3,6 +3,7 @@
 import cython
 from cython import Py_ssize_t
 
+from libc.math cimport ceil, floor, rint, sqrt
 from libc.stdlib cimport malloc, free
 
 import numpy as np
@@ -17,7 +18,8 @@ from util cimport numeric, get_nat
 
 from algos cimport (swap, TiebreakEnumType, TIEBREAK_AVERAGE, TIEBREAK_MIN,
                     TIEBREAK_MAX, TIEBREAK_FIRST, TIEBREAK_DENSE)
-from algos import take_2d_axis1_float64_float64, groupsort_indexer, tiebreakers
+from algos import (take_2d_axis1_float64_float64,
+                   take_2d_axis1_int64_int64, groupsort_indexer, tiebreakers)
 
 cdef int64_t NPY_NAT = get_nat()
 
@@ -66,12 +68,12 @@ cdef inline float64_t median_linear(float64_t* a, int n) nogil:
 
 
 # TODO: Is this redundant with algos.kth_smallest
-cdef inline float64_t kth_smallest_c(float64_t* a,
-                                     Py_ssize_t k,
-                                     Py_ssize_t n) nogil:
+cdef inline numeric kth_smallest_c(numeric* a,
+                                   Py_ssize_t k,
+                                   Py_ssize_t n) nogil:
     cdef:
         Py_ssize_t i, j, l, m
-        float64_t x, t
+        numeric x, t
 
     l = 0
     m = n - 1
@@ -134,6 +136,250 @@ def group_median_float64(ndarray[float64_t, ndim=2] out,
                 ptr += size
 
 
+cdef enum QuantileInterpolation:
+    INTERPOLATION_LINEAR,
+    INTERPOLATION_LOWER,
+    INTERPOLATION_HIGHER,
+    INTERPOLATION_MIDPOINT,
+    INTERPOLATION_NEAREST
+
+
+cdef inline void quantile_bounds(Py_ssize_t n, float64_t q,
+                                 QuantileInterpolation interpolation,
+                                 Py_ssize_t* below, Py_ssize_t* above,
+                                 float64_t* weight_above) nogil:
+    """
+    The positions of the order statistics of n values between which the
+    quantile q is interpolated as numpy.percentile does, and the weight of
+    the one above. Both are the same order statistic for the interpolations
+    which select a single value.
+    """
+    cdef:
+        float64_t idx = q * (n - 1)
+
+    if interpolation == INTERPOLATION_LOWER:
+        below[0] = <Py_ssize_t>floor(idx)
+    elif interpolation == INTERPOLATION_HIGHER:
+        below[0] = <Py_ssize_t>ceil(idx)
+    elif interpolation == INTERPOLATION_NEAREST:
+        # rounding half to even, as numpy.around
+        below[0] = <Py_ssize_t>rint(idx)
+    else:
+        if interpolation == INTERPOLATION_MIDPOINT:
+            idx = 0.5 * (floor(idx) + ceil(idx))
+        below[0] = <Py_ssize_t>floor(idx)
+        above[0] = below[0] + 1
+        if above[0] > n - 1:
+            above[0] = n - 1
+        weight_above[0] = idx - below[0]
+        return
+
+    above[0] = below[0]
+    weight_above[0] = 0
+
+
+cdef inline float64_t quantile_selection(float64_t* a, Py_ssize_t n,
+                                         float64_t q,
+                                         QuantileInterpolation interpolation
+                                         ) nogil:
+    """
+    The quantile q of the n values of a, without missing values,
+    interpolated as numpy.percentile does. a is partially reordered.
+    """
+    cdef:
+        Py_ssize_t below, above
+        float64_t weight_above
+
+    if n == 0:
+        return NaN
+
+    quantile_bounds(n, q, interpolation, &below, &above, &weight_above)
+    if interpolation in (INTERPOLATION_LOWER, INTERPOLATION_HIGHER,
+                         INTERPOLATION_NEAREST):
+        return kth_smallest_c(a, below, n)
+
+    return (kth_smallest_c(a, below, n) * (1.0 - weight_above) +
+            kth_smallest_c(a, above, n) * weight_above)
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_quantile(ndarray[float64_t, ndim=3] out,
+                   ndarray[int64_t] counts,
+                   ndarray[float64_t, ndim=2] values,
+                   ndarray[int64_t] labels,
+                   ndarray[float64_t] qs,
+                   object interpolation='linear'):
+    """
+    Only aggregates on axis=0
+
+    out[i, j, k] is the quantile qs[k] of the non-missing values of the
+    column j in the group i, interpolated as numpy.percentile does. The
+    order statistics are found by selection, without sorting the groups.
+    """
+    cdef:
+        Py_ssize_t i, j, k, m, n, N, K, nq, ngroups, size
+        ndarray[int64_t] _counts
+        ndarray[float64_t, ndim=2] data
+        float64_t* ptr
+        QuantileInterpolation interp
+
+    interp = {'linear': INTERPOLATION_LINEAR,
+              'lower': INTERPOLATION_LOWER,
+              'higher': INTERPOLATION_HIGHER,
+              'midpoint': INTERPOLATION_MIDPOINT,
+              'nearest': INTERPOLATION_NEAREST}[interpolation]
+
+    ngroups = len(counts)
+    nq = len(qs)
+    N, K = (<object>values).shape
+
+    indexer, _counts = groupsort_indexer(labels, ngroups)
+    counts[:] = _counts[1:]
+
+    data = np.empty((K, N), dtype=np.float64)
+    ptr = <float64_t*>cnp.PyArray_DATA(data)
+
+    take_2d_axis1_float64_float64(values.T, indexer, out=data)
+
+    with nogil:
+
+        for j in range(K):
+            # exclude NA group
+            ptr += _counts[0]
+            for i in range(ngroups):
+                size = _counts[i + 1]
+
+                # move the non-missing values to the front of the group
+                n = 0
+                for m in range(size):
+                    if ptr[m] == ptr[m]:
+                        ptr[n] = ptr[m]
+                        n += 1
+
+                for k in range(nq):
+                    out[i, j, k] = quantile_selection(ptr, n, qs[k], interp)
+                ptr += size
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_quantile_int64(ndarray[int64_t, ndim=4] out,
+                         ndarray[float64_t, ndim=3] weights,
+                         ndarray[int64_t] counts,
+                         ndarray[int64_t, ndim=2] values,
+                         ndarray[int64_t] labels,
+                         ndarray[float64_t] qs,
+                         object interpolation='linear',
+                         bint is_datetimelike=False):
+    """
+    Only aggregates on axis=0
+
+    out[i, j, k, 0] and out[i, j, k, 1] are the order statistics of the
+    non-missing values of the column j in the group i between which the
+    quantile qs[k] is interpolated, weights[i, j, k] the weight of the
+    second one (NaN for a group without values). The order statistics are
+    selected on the int64 values, which float64 cannot all represent.
+    Missing values are NaT if is_datetimelike, there are none otherwise.
+    """
+    cdef:
+        Py_ssize_t i, j, k, m, n, N, K, nq, ngroups, size
+        Py_ssize_t below, above
+        float64_t weight_above
+        ndarray[int64_t] _counts
+        ndarray[int64_t, ndim=2] data
+        int64_t* ptr
+        QuantileInterpolation interp
+
+    interp = {'linear': INTERPOLATION_LINEAR,
+              'lower': INTERPOLATION_LOWER,
+              'higher': INTERPOLATION_HIGHER,
+              'midpoint': INTERPOLATION_MIDPOINT,
+              'nearest': INTERPOLATION_NEAREST}[interpolation]
+
+    ngroups = len(counts)
+    nq = len(qs)
+    N, K = (<object>values).shape
+
+    indexer, _counts = groupsort_indexer(labels, ngroups)
+    counts[:] = _counts[1:]
+
+    data = np.empty((K, N), dtype=np.int64)
+    ptr = <int64_t*>cnp.PyArray_DATA(data)
+
+    take_2d_axis1_int64_int64(values.T, indexer, out=data, fill_value=0)
+
+    with nogil:
+
+        for j in range(K):
+            # exclude NA group
+            ptr += _counts[0]
+            for i in range(ngroups):
+                size = _counts[i + 1]
+
+                # move the non-missing values to the front of the group
+                n = size
+                if is_datetimelike:
+                    n = 0
+                    for m in range(size):
+                        if ptr[m] != NPY_NAT:
+                            ptr[n] = ptr[m]
+                            n += 1
+
+                for k in range(nq):
+                    if n == 0:
+                        out[i, j, k, 0] = out[i, j, k, 1] = 0
+                        weights[i, j, k] = NaN
+                        continue
+                    quantile_bounds(n, qs[k], interp, &below, &above,
+                                    &weight_above)
+                    out[i, j, k, 0] = kth_smallest_c(ptr, below, n)
+                    out[i, j, k, 1] = kth_smallest_c(ptr, above, n)
+                    weights[i, j, k] = weight_above
+                ptr += size
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_hll(uint8_t[:, :] registers,
+              const int64_t[:] labels,
+              const uint64_t[:] hashes,
+              int precision):
+    """
+    Update the HyperLogLog registers of each group with hashed values
+
+    The first ``precision`` bits of a hash select one of the
+    ``2 ** precision`` registers of its group, which keeps the largest
+    position of the first set bit in the remaining bits.
+    """
+    cdef:
+        Py_ssize_t i, N = len(labels)
+        int64_t lab
+        uint64_t h, top = (<uint64_t>1) << 63
+        uint8_t rho, rho_max = 64 - precision + 1
+        Py_ssize_t idx
+
+    if len(hashes) != N:
+        raise AssertionError('len(labels) != len(hashes)')
+
+    with nogil:
+        for i in range(N):
+            lab = labels[i]
+            if lab < 0:
+                continue
+
+            h = hashes[i]
+            idx = <Py_ssize_t>(h >> (64 - precision))
+            h <<= precision
+            rho = 1
+            while rho < rho_max and not (h & top):
+                h <<= 1
+                rho += 1
+
+            if rho > registers[lab, idx]:
+                registers[lab, idx] = rho
+
+
 @cython.boundscheck(False)
 @cython.wraparound(False)
 def group_cumprod_float64(float64_t[:, :] out,
@@ -171,3 +171,68 @@ def unique_label_indices(ndarray[int64_t, ndim=1] labels):
     arr = arr[labels[arr].argsort()]
 
     return arr[1:] if arr.size != 0 and labels[arr[0]] == -1 else arr
+
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def group_value_counts(ndarray[int64_t, ndim=1] labels,
+                       ndarray[int64_t, ndim=1] codes,
+                       int64_t ncodes):
+    """
+    Count the distinct (label, code) pairs with a single hashed pass.
+
+    Pairs where either the label or the code is -1 are skipped.
+
+    Parameters
+    ----------
+    labels : ndarray[int64]
+        group labels, -1 for a missing group
+    codes : ndarray[int64]
+        factorized values in ``range(ncodes)``, -1 for a missing value
+    ncodes : int64
+        number of distinct values
+
+    Returns
+    -------
+    pair_labels : ndarray[int64]
+    pair_codes : ndarray[int64]
+    counts : ndarray[int64]
+        one entry per distinct pair, in order of first appearance
+    """
+    cdef:
+        int ret = 0
+        Py_ssize_t i, n = len(labels), nuniq = 0
+        int64_t lab, code, pos
+        khiter_t k
+        kh_int64_t *table
+        ndarray[int64_t, ndim=1] pair_labels, pair_codes, counts
+
+    if len(codes) != n:
+        raise AssertionError('len(labels) != len(codes)')
+
+    pair_labels = np.empty(n, dtype=np.int64)
+    pair_codes = np.empty(n, dtype=np.int64)
+    counts = np.zeros(n, dtype=np.int64)
+
+    table = kh_init_int64()
+    kh_resize_int64(table, min(n, _SIZE_HINT_LIMIT))
+
+    with nogil:
+        for i in range(n):
+            lab = labels[i]
+            code = codes[i]
+            if lab < 0 or code < 0:
+                continue
+
+            k = kh_put_int64(table, lab * ncodes + code, &ret)
+            if ret != 0:
+                table.vals[k] = nuniq
+                pair_labels[nuniq] = lab
+                pair_codes[nuniq] = code
+                nuniq += 1
+            counts[table.vals[k]] += 1
+
+    kh_destroy_int64(table)
+
+    return (pair_labels[:nuniq].copy(), pair_codes[:nuniq].copy(),
+            counts[:nuniq].copy())